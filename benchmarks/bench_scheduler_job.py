@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+"""
+Memory per job and serialization time of SchedulerJob and JobBatch.
+
+Compares them against the original dict based SchedulerJob, kept below as
+LegacySchedulerJob. Run from the repository root:
+
+    python benchmarks/bench_scheduler_job.py
+
+Each timed submit builds a new job, as a backfill submits every job once,
+so the frozen job pays for its first serialization too.
+"""
+from typing import Dict, List, Union
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyoracloud import ess  # noqa: E402
+
+JOBS = 50000
+PACKAGE = "/oracle/apps/ess/financials/commonModules/shared/common/interfaceLoader/"
+DEFINITION = "SyncBellNotifications"
+
+
+class LegacySchedulerJob:
+    def __init__(self, package: str, definition: str) -> None:
+        self.package = package
+        self.definition = definition
+        self.parameters: List[str] = []
+
+    @property
+    def ess_parameter(self) -> str:
+        if len(self.parameters) == 0:
+            return ess.ESS_PARAM_NULL
+        return ",".join(self.parameters)
+
+    @property
+    def payload(self) -> Dict[str, Union[str, None]]:
+        return {
+            "OperationName": "submitESSJobRequest",
+            "JobPackageName": self.package,
+            "JobDefName": self.definition,
+            "ESSParameters": self.ess_parameter,
+            "ReqstId": None,
+        }
+
+    def add_parameter(self, parameter: Union[str, None]):
+        if parameter is None:
+            parameter = ess.ESS_PARAM_NULL
+        self.parameters.append(str(parameter))
+
+
+def legacy_jobs():
+    jobs = []
+    for i in range(JOBS):
+        job = LegacySchedulerJob(PACKAGE, DEFINITION)
+        job.add_parameter(str(i))
+        job.add_parameter(None)
+        jobs.append(job)
+    return jobs
+
+
+def frozen_jobs(serialized: bool = False):
+    jobs = []
+    for i in range(JOBS):
+        job = ess.SchedulerJob(PACKAGE, DEFINITION)
+        job.add_parameter(str(i))
+        job.add_parameter(None)
+        job.freeze()
+        if serialized:
+            job.body
+        jobs.append(job)
+    return jobs
+
+
+def job_batch():
+    batch = ess.JobBatch()
+    for i in range(JOBS):
+        batch.add(PACKAGE, DEFINITION, [str(i), None])
+    return batch
+
+
+def bytes_per_job(build) -> float:
+    tracemalloc.start()
+    jobs = build()  # noqa: F841, kept alive while measuring
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size / JOBS
+
+
+def usec_per_submit(serialize) -> float:
+    return timeit.timeit(serialize, number=100000) * 10
+
+
+def main() -> None:
+    print(f"Memory per job ({JOBS} jobs, two parameters)")
+    print(f"  legacy SchedulerJob           {bytes_per_job(legacy_jobs):7.1f} B")
+    print(f"  frozen SchedulerJob           {bytes_per_job(frozen_jobs):7.1f} B")
+    print(
+        "  frozen SchedulerJob, sent     "
+        f"{bytes_per_job(lambda: frozen_jobs(True)):7.1f} B"
+    )
+    print(f"  JobBatch                      {bytes_per_job(job_batch):7.1f} B")
+
+    def legacy_submit():
+        legacy = LegacySchedulerJob(PACKAGE, DEFINITION)
+        legacy.add_parameter("1")
+        return json.dumps(legacy.payload), json.dumps(legacy.payload)
+
+    def frozen_submit():
+        frozen = ess.SchedulerJob(PACKAGE, DEFINITION)
+        frozen.add_parameter("1")
+        frozen.freeze()
+        return frozen.body.decode(), frozen.body
+
+    print("Job creation and serialization per submit (log line and request body)")
+    print(f"  legacy SchedulerJob           {usec_per_submit(legacy_submit):7.2f} us")
+    print(f"  frozen SchedulerJob           {usec_per_submit(frozen_submit):7.2f} us")
+
+
+if __name__ == "__main__":
+    main()
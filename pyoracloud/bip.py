@@ -91,6 +91,20 @@ class BipScheduler:
             delivery_channels.append(delivery_channel)
         sch_rqst.append(bip_rpt.get_report_request())
 
-        request = bip_rpt.pod.get_request()
-
-        self.pod.display_message(f"Payload:  {ET.tostring(soap_envelope)}")
+        payload = ET.tostring(soap_envelope)
+        self.pod.display_message(f"Payload:  {payload}")
+
+        bip_response = self.pod.post(
+            self.schedule_report_url,
+            data=payload,
+            headers={"content-type": "application/soap+xml; charset=utf-8"},
+        )
+        self.pod.display_message(f"Response: {bip_response.status_code}")
+        bip_response.raise_for_status()
+
+        response_envelope = ET.fromstring(bip_response.content)
+        job_id = response_envelope.find(".//sch:scheduleReportReturn", NS_MAP)
+        if job_id is None:
+            return None
+        self.pod.metrics.assign(job_id.text, bip_response, len(payload))
+        return job_id.text
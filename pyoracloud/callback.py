@@ -0,0 +1,245 @@
+"""
+Oracle Cloud ERP Integration job completion callbacks.
+"""
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+import hmac
+import json
+import secrets
+import threading
+
+try:
+    from . import exceptions
+except ImportError:
+    import exceptions
+
+MAX_EARLY_NOTIFICATIONS = 1024
+WILDCARD_HOSTS = ("", "0.0.0.0", "::")
+
+
+class CompletionRegistry:
+    """
+    Completion Registry API
+    """
+
+    def __init__(self) -> None:
+        """
+        Creates a new Completion Registry.
+
+        This class maps ESS request ids to futures, which are resolved with
+        the job status when a completion notification arrives. Notifications
+        received before the request id is registered are kept until it is,
+        up to MAX_EARLY_NOTIFICATIONS of them.
+
+        Example:
+        >>> from pyoracloud import callback
+        >>> registry = callback.CompletionRegistry()
+        >>> future = registry.register("123456")
+        >>> registry.resolve("123456", "SUCCEEDED")
+        >>> future.result()
+        'SUCCEEDED'
+        """
+        self.__lock = threading.Lock()
+        self.__futures: Dict[str, Future] = {}
+        self.__early: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.__futures)
+
+    def register(self, request_id: str) -> Future:
+        """
+        Args:
+            request_id (str): The request id of the job.
+        Returns:
+            Future: Resolved with the status of the job.
+        """
+        request_id = str(request_id)
+        with self.__lock:
+            future = self.__futures.get(request_id)
+            if future is None:
+                future = self.__futures[request_id] = Future()
+            status = self.__early.pop(request_id, None)
+        if status is not None:
+            self.resolve(request_id, status)
+        return future
+
+    def resolve(self, request_id: str, request_status: str) -> bool:
+        """
+        Args:
+            request_id (str): The request id of the job.
+            request_status (str): The status of the job.
+        Returns:
+            bool: True if a registered future was resolved.
+        """
+        request_id = str(request_id)
+        with self.__lock:
+            future = self.__futures.pop(request_id, None)
+            if future is None:
+                self.__early[request_id] = request_status
+                if len(self.__early) > MAX_EARLY_NOTIFICATIONS:
+                    del self.__early[next(iter(self.__early))]
+                return False
+        if not future.done():
+            future.set_result(request_status)
+        return True
+
+    def discard(self, request_id: str) -> None:
+        """
+        Args:
+            request_id (str): The request id of the job to stop tracking.
+        """
+        request_id = str(request_id)
+        with self.__lock:
+            self.__futures.pop(request_id, None)
+            self.__early.pop(request_id, None)
+
+
+def parse_notification(body: bytes) -> List[Tuple[str, str]]:
+    """
+    Args:
+        body (bytes): The JSON body of a callback notification.
+    Returns:
+        List[Tuple[str, str]]: The request ids and statuses it reports.
+
+    The ERP callback lists the jobs under "JOBS" with "JOBID" and "STATUS";
+    a single {"ReqstId": ..., "RequestStatus": ...} object is also accepted.
+    """
+    message = json.loads(body.decode("utf-8"))
+    if "JOBS" in message:
+        return [(str(job["JOBID"]), job["STATUS"]) for job in message["JOBS"]]
+    return [(str(message["ReqstId"]), message["RequestStatus"])]
+
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _CallbackHandler(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:
+        listener = self.server.listener
+        token = parse_qs(urlsplit(self.path).query).get("token", [""])[0]
+        if not hmac.compare_digest(token, listener.token):
+            self.send_response(403)
+            self.end_headers()
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            notifications = parse_notification(self.rfile.read(length))
+        except (ValueError, KeyError, TypeError):
+            self.send_response(400)
+            self.end_headers()
+            return
+
+        for request_id, request_status in notifications:
+            listener.display_message(f"Callback: {request_id} {request_status}")
+            listener.registry.resolve(request_id, request_status)
+
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class CallbackListener:
+    """
+    Callback Listener API
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        public_url: str = None,
+        registry: CompletionRegistry = None,
+        verbose: bool = False,
+    ) -> None:
+        """
+        Creates a new Callback Listener.
+
+        This class runs a small HTTP server in a background thread and
+        resolves the futures in its registry when a callback is POSTed.
+        The listener url carries a random token, callbacks without it are
+        rejected with 403 Forbidden.
+
+        Args:
+            host (str): The interface to listen on.
+            port (int): The port to listen on, 0 picks a free port.
+            public_url (str): The URL the pod should call, if the listener
+                is behind a proxy or NAT. Defaults to http://host:port/,
+                and is required when host is a wildcard address.
+            registry (CompletionRegistry): The registry to resolve.
+            verbose (bool): Print the notifications received.
+
+        Example:
+        >>> from pyoracloud import callback, ess
+        >>> with callback.CallbackListener(public_url="https://me/cb") as cb:
+        ...     scheduler = ess.EnterpriseScheduler(pod, listener=cb)
+        ...     scheduler.run(job)
+        """
+        self.host = host
+        self.port = port
+        self.public_url = public_url
+        self.registry = registry if registry is not None else CompletionRegistry()
+        self.verbose = verbose
+        self.token = secrets.token_urlsafe(16)
+        self.__server: _ThreadingHTTPServer = None
+        self.__thread: threading.Thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        Returns:
+            str: The CallbackURL to give the pod, including the token.
+        """
+        if not self.running:
+            raise exceptions.CallbackListenerError("listener is not running")
+        if self.public_url:
+            url = self.public_url
+        elif self.host in WILDCARD_HOSTS:
+            raise exceptions.CallbackListenerError(
+                f"public_url is required when listening on {self.host!r}"
+            )
+        else:
+            url = f"http://{self.host}:{self.port}/"
+        separator = "&" if "?" in url else "?"
+        return f"{url}{separator}token={self.token}"
+
+    @property
+    def running(self) -> bool:
+        return self.__server is not None
+
+    def start(self) -> "CallbackListener":
+        if self.__server is None:
+            self.__server = _ThreadingHTTPServer(
+                (self.host, self.port), _CallbackHandler
+            )
+            self.__server.listener = self
+            self.port = self.__server.server_address[1]
+            self.__thread = threading.Thread(
+                target=self.__server.serve_forever, daemon=True
+            )
+            self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__thread.join()
+            self.__server = None
+            self.__thread = None
+
+    def display_message(self, message: str) -> None:
+        if self.verbose:
+            print(message)
+
+    def __enter__(self) -> "CallbackListener":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
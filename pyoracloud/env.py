@@ -1,6 +1,88 @@
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+import threading
 import requests
+from requests.models import Response
 from requests.sessions import Session
 
+ACCEPT_ENCODING = "gzip, deflate"
+MAX_ETAGS = 256
+MAX_JOB_METRICS = 1024
+
+
+def transfer_size(response: Response) -> int:
+    """
+    Args:
+        response (Response): A response whose content has been read.
+    Returns:
+        int: The body bytes read from the wire, before decompression.
+    """
+    raw = getattr(response, "raw", None)
+    if raw is not None and hasattr(raw, "tell"):
+        try:
+            return raw.tell()
+        except (OSError, ValueError):
+            pass
+    return len(response.content or b"")
+
+
+class PodMetrics:
+    """
+    Bytes transferred to and from a pod, in total and per job.
+
+    Only the last MAX_JOB_METRICS jobs are kept per job, pop() a job's
+    numbers to keep them.
+    """
+
+    FIELDS = (
+        "requests",
+        "not_modified",
+        "bytes_sent",
+        "bytes_received",
+        "bytes_decoded",
+    )
+
+    def __init__(self) -> None:
+        self.totals: Dict[str, int] = dict.fromkeys(self.FIELDS, 0)
+        self.jobs: "OrderedDict[str, Dict[str, int]]" = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def record(self, key: str, response: Response, sent: int = 0) -> None:
+        """
+        Args:
+            key (str): The job to charge the exchange to, None for totals only.
+            response (Response): The response received.
+            sent (int): The request body bytes sent.
+        """
+        with self.__lock:
+            self.__add(self.totals, response, sent)
+        if key is not None:
+            self.assign(key, response, sent)
+
+    def assign(self, key: str, response: Response, sent: int = 0) -> None:
+        """
+        Charges an exchange already in the totals to a job, e.g. the submit
+        response once its request id is known.
+        """
+        with self.__lock:
+            stats = self.jobs.get(key)
+            if stats is None:
+                stats = self.jobs[key] = dict.fromkeys(self.FIELDS, 0)
+                if len(self.jobs) > MAX_JOB_METRICS:
+                    self.jobs.popitem(last=False)
+            self.__add(stats, response, sent)
+
+    def pop(self, key: str) -> Dict[str, int]:
+        with self.__lock:
+            return self.jobs.pop(key, dict.fromkeys(self.FIELDS, 0))
+
+    def __add(self, stats: Dict[str, int], response: Response, sent: int) -> None:
+        stats["requests"] += 1
+        stats["not_modified"] += response.status_code == 304
+        stats["bytes_sent"] += sent
+        stats["bytes_received"] += transfer_size(response)
+        stats["bytes_decoded"] += len(response.content or b"")
+
 
 class Pod:
     def __init__(
@@ -18,11 +100,22 @@ class Pod:
         self.verbose = verbose
         self.max_poll = max_poll
         self.poll_interval = poll_interval  # Sec
+        self.metrics = PodMetrics()
+        self.__request: Session = None
+        self.__etags: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self.__etags_lock = threading.Lock()
+
+    @property
+    def request(self) -> Session:
+        if self.__request is None:
+            self.__request = self.get_request()
+        return self.__request
 
     def get_request(
         self,
         headers={
             "content-type": "application/json",
+            "accept-encoding": ACCEPT_ENCODING,
         },
     ) -> Session:
         cloud_request = requests.Session()
@@ -30,6 +123,64 @@ class Pod:
         cloud_request.headers.update(headers)
         return cloud_request
 
+    def post(self, url: str, data: bytes, key: str = None, **kwargs) -> Response:
+        """
+        Args:
+            url (str): The URL to post to.
+            data (bytes): The request body.
+            key (str): The job to charge the transfer to in metrics.
+        Returns:
+            Response: The response, decompressed if the pod compressed it.
+        """
+        response = self.request.post(url, data=data, **kwargs)
+        self.metrics.record(key, response, len(data))
+        return response
+
+    def get_json(self, url: str, key: str = None) -> Any:
+        """
+        Conditional GET of a JSON resource.
+
+        When the pod returned an ETag for the URL, the request is sent with
+        If-None-Match and a 304 Not Modified reuses the last decoded body.
+
+        Args:
+            url (str): The URL to get.
+            key (str): The job to charge the transfer to in metrics.
+        Returns:
+            Any: The decoded JSON body.
+        """
+        headers = {}
+        with self.__etags_lock:
+            cached = self.__etags.get(url)
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
+        response = self.request.get(url, headers=headers)
+        self.metrics.record(key, response)
+
+        if response.status_code == 304:
+            if cached is not None:
+                return cached[1]
+            raise requests.HTTPError(
+                f"304 Not Modified without a cached body for url: {url}",
+                response=response,
+            )
+
+        response.raise_for_status()
+        content = response.json()
+        etag = response.headers.get("ETag")
+        with self.__etags_lock:
+            self.__etags.pop(url, None)
+            if etag:
+                self.__etags[url] = (etag, content)
+                if len(self.__etags) > MAX_ETAGS:
+                    self.__etags.popitem(last=False)
+        return content
+
+    def forget(self, url: str) -> None:
+        with self.__etags_lock:
+            self.__etags.pop(url, None)
+
     def display_message(self, message: str) -> None:
         if self.verbose:
             print(message)
@@ -1,18 +1,24 @@
 """
 Oracle Cloud Enterprise Schedule Service.
 """
-from typing import Dict, Tuple, Union, List
+from concurrent import futures
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import json
 import time
 
 try:
+    from . import callback
     from . import exceptions
     from . import env
+    from . import stats as runtime_stats
 except ImportError:
+    import callback
     import exceptions
     import env
+    import stats as runtime_stats
 
 ESS_PARAM_NULL = "#NULL"
+BACKOFF_QUANTILE = 0.25
 
 
 class SchedulerJob:
@@ -20,6 +26,8 @@ class SchedulerJob:
     Scheduler Job API
     """
 
+    __slots__ = ("package", "definition", "parameters", "_body", "_frozen")
+
     def __init__(self, package: str, definition: str) -> None:
         """
         Creates a new Scheduler Job.
@@ -40,10 +48,31 @@ class SchedulerJob:
         >>> my_definition = "SyncBellNotifications"
         >>> job = ess.SchedulerJob(my_package, my_definition)
         """
+        object.__setattr__(self, "_frozen", False)
+        object.__setattr__(self, "_body", None)
         self.package = package
         self.definition = definition
         self.parameters: List[str] = []
 
+    def __setattr__(self, name: str, value) -> None:
+        if self._frozen:
+            raise exceptions.FrozenJobError(name)
+        object.__setattr__(self, name, value)
+
+    def __repr__(self) -> str:
+        return f"SchedulerJob({self.package!r}, {self.definition!r})"
+
+    def __getstate__(self) -> Dict[str, object]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    @property
+    def frozen(self) -> bool:
+        return self._frozen
+
     @property
     def ess_parameter(self) -> str:
         """
@@ -60,13 +89,19 @@ class SchedulerJob:
         Returns:
             Dict[str, Union[str, None]]: The payload for the job.
         """
-        return {
-            "OperationName": "submitESSJobRequest",
-            "JobPackageName": self.package,
-            "JobDefName": self.definition,
-            "ESSParameters": self.ess_parameter,
-            "ReqstId": None,
-        }
+        return _build_payload(self.package, self.definition, self.ess_parameter)
+
+    @property
+    def body(self) -> bytes:
+        """
+        Returns:
+            bytes: The serialized payload, cached once the job is frozen.
+        """
+        if not self._frozen:
+            return json.dumps(self.payload).encode()
+        if self._body is None:
+            object.__setattr__(self, "_body", json.dumps(self.payload).encode())
+        return self._body
 
     def add_parameter(self, parameter: Union[str, None]):
         """
@@ -83,25 +118,186 @@ class SchedulerJob:
         >>> print(job.ess_parameter)
         PARAM1,#NULL
         """
+        if self._frozen:
+            raise exceptions.FrozenJobError("parameters")
         if parameter is None:
             parameter = ESS_PARAM_NULL
         self.parameters.append(str(parameter))
 
+    def freeze(self) -> "SchedulerJob":
+        """
+        Makes the job immutable, so its body is serialized only once, on
+        first use.
+
+        Returns:
+            SchedulerJob: The same job, to allow chaining.
+
+        Example:
+        --------
+        >>> job = ess.SchedulerJob(my_package, my_definition).freeze()
+        >>> job.add_parameter("PARAM1")
+        Traceback (most recent call last):
+        ...
+        pyoracloud.exceptions.exceptions.FrozenJobError: ...
+        """
+        if not self._frozen:
+            object.__setattr__(self, "parameters", tuple(self.parameters))
+            object.__setattr__(self, "_frozen", True)
+        return self
+
+
+class JobBatch:
+    """
+    Column-wise store of many Scheduler Jobs
+    """
+
+    __slots__ = ("packages", "definitions", "parameters", "_names")
+
+    def __init__(self) -> None:
+        """
+        Creates a new, empty Job Batch.
+
+        Package and definition names are interned, so a backfill of the same
+        job with different parameters only keeps one copy of each name.
+        Jobs and payloads are built on demand when the batch is read.
+
+        Example:
+        >>> from pyoracloud import ess
+        >>> batch = ess.JobBatch()
+        >>> batch.add(my_package, my_definition, ["2021-01-01", None])
+        >>> for job in batch:
+        ...     scheduler.submit(job)
+        """
+        self.packages: List[str] = []
+        self.definitions: List[str] = []
+        self.parameters: List[Tuple[str, ...]] = []
+        self._names: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.packages)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[SchedulerJob, "JobBatch"]:
+        if isinstance(index, slice):
+            batch = JobBatch()
+            batch.packages = self.packages[index]
+            batch.definitions = self.definitions[index]
+            batch.parameters = self.parameters[index]
+            batch._names = dict(self._names)
+            return batch
+        if not isinstance(index, int):
+            index_type = type(index).__name__
+            raise TypeError(
+                f"JobBatch indices must be integers or slices, not {index_type}"
+            )
+        job = SchedulerJob(self.packages[index], self.definitions[index])
+        job.parameters.extend(self.parameters[index])
+        return job.freeze()
+
+    def __iter__(self) -> Iterator[SchedulerJob]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def add(
+        self,
+        package: str,
+        definition: str,
+        parameters: Iterable[Union[str, None]] = (),
+    ) -> None:
+        """
+        Args:
+            package (str): The package name of the job.
+            definition (str): The definition name of the job.
+            parameters (Iterable[str]): The parameters, None is added as #NULL.
+        """
+        params = tuple(ESS_PARAM_NULL if p is None else str(p) for p in parameters)
+        self.packages.append(self._names.setdefault(package, package))
+        self.definitions.append(self._names.setdefault(definition, definition))
+        self.parameters.append(params)
+
+    def add_job(self, job: SchedulerJob) -> None:
+        """
+        Args:
+            job (SchedulerJob): The job to copy into the batch.
+        """
+        self.add(job.package, job.definition, job.parameters)
+
+    def payload(self, index: int) -> Dict[str, Union[str, None]]:
+        """
+        Args:
+            index (int): The position of the job in the batch.
+        Returns:
+            Dict[str, Union[str, None]]: The payload for the job.
+        """
+        params = self.parameters[index]
+        ess_parameter = ",".join(params) if params else ESS_PARAM_NULL
+        return _build_payload(
+            self.packages[index], self.definitions[index], ess_parameter
+        )
+
+    def body(self, index: int) -> bytes:
+        """
+        Args:
+            index (int): The position of the job in the batch.
+        Returns:
+            bytes: The serialized payload for the job.
+        """
+        return json.dumps(self.payload(index)).encode()
+
+
+def _build_payload(
+    package: str, definition: str, ess_parameter: str
+) -> Dict[str, Union[str, None]]:
+    return {
+        "OperationName": "submitESSJobRequest",
+        "JobPackageName": package,
+        "JobDefName": definition,
+        "ESSParameters": ess_parameter,
+        "ReqstId": None,
+    }
+
 
 class EnterpriseScheduler:
     """
     Enterprise Scheduler API
     """
 
-    def __init__(self, pod: env.Pod) -> None:
+    def __init__(
+        self,
+        pod: env.Pod,
+        listener: callback.CallbackListener = None,
+        fallback_poll_interval: int = None,
+        stats: runtime_stats.RuntimeStore = None,
+    ) -> None:
         """
         Creates a new Enterprise Scheduler.
 
         This class defines a Enterprise Scheduler, which can be used to submit
         a Job to the Oracle Cloud ESS.
 
+        With a listener, jobs are submitted with its CallbackURL and monitor()
+        waits for the completion notification, polling the job status only
+        every fallback_poll_interval seconds in case one is missed. A final
+        status from a callback is confirmed with one poll before returning.
+        Either way, monitor() gives up after pod.max_poll x pod.poll_interval
+        seconds.
+
+        Args:
+            pod (env.Pod): The pod to submit the jobs to.
+            listener (callback.CallbackListener): Optional callback listener.
+            fallback_poll_interval (int): Seconds between status polls while
+                waiting for a callback. Defaults to 6 x pod.poll_interval.
+            stats (stats.RuntimeStore): Optional store the runtimes of run()
+                are recorded in. When polling, the wait between polls then
+                doubles until the job's BACKOFF_QUANTILE past runtime, so a
+                recorded runtime is at most about twice the real one and
+                the estimate follows jobs that get faster.
         """
         self.pod = pod
+        self.listener = listener
+        if fallback_poll_interval is None:
+            fallback_poll_interval = 6 * pod.poll_interval
+        self.fallback_poll_interval = fallback_poll_interval
+        self.stats = stats
         self.__run_request_id: str = None
         self.__run_status: str = None
 
@@ -144,7 +340,11 @@ class EnterpriseScheduler:
             Tuple[str, str]: The request id and status of the run.
         """
         self.__run_request_id = self.submit(job)
-        self.__run_status = self.monitor(self.run_request_id)
+        started = time.monotonic()
+        self.__run_status = self.monitor(self.run_request_id, job)
+        if self.stats is not None:
+            # Includes up to one poll interval between completion and poll.
+            self.stats.record(job, time.monotonic() - started)
         return self.__run_request_id, self.__run_status
 
     def submit(self, job: SchedulerJob) -> str:
@@ -156,23 +356,31 @@ class EnterpriseScheduler:
         """
         self.pod.display_message(f"Submitting {job}")
         self.pod.display_message(f"Url:  {self.erp_integration}")
-        self.pod.display_message(f"Payload:  {json.dumps(job.payload)}")
-        ess_response = self.pod.request.post(
-            self.erp_integration, data=json.dumps(job.payload)
-        )
+        if self.listener is None:
+            body = job.body
+            self.pod.display_message(f"Payload:  {body.decode()}")
+        else:
+            payload = dict(job.payload, CallbackURL=self.listener.url)
+            body = json.dumps(payload).encode()
+            masked = body.decode().replace(self.listener.token, "***")
+            self.pod.display_message(f"Payload:  {masked}")
+        ess_response = self.pod.post(self.erp_integration, data=body)
 
         self.pod.display_message(f"Response: {ess_response.status_code}")
         ess_response.raise_for_status()
 
         request_id = ess_response.json()["ReqstId"]
+        self.pod.metrics.assign(request_id, ess_response, len(body))
         self.pod.display_message(f"Request Id : {request_id}")
 
         return request_id
 
-    def monitor(self, request_id: str) -> str:
+    def monitor(self, request_id: str, job: SchedulerJob = None) -> str:
         """
         Args:
             request_id (str): The request id of the job.
+            job (SchedulerJob): The job, to space the polls from its past
+                runtimes.
         Returns:
             str: The status of the job.
         """
@@ -183,22 +391,103 @@ class EnterpriseScheduler:
         self.pod.display_message(f"Max poll: {self.pod.max_poll}")
         self.pod.display_message(f"Poll interval: {self.pod.poll_interval} sec")
 
-        request_status = None
-        for _ in range(self.pod.max_poll):
-            time.sleep(self.pod.poll_interval)
-            monitor_response = self.pod.request.get(ess_monitor_url)
-            monitor_response.raise_for_status()
-            items = monitor_response.json()["items"]
-            request_status = items[0]["RequestStatus"]
-            self.pod.display_message(f"{monitor_response} {request_status}")
+        try:
+            if self.listener is None:
+                request_status = self.poll(request_id, job)
+            else:
+                request_status = self.wait_for_callback(request_id)
+        finally:
+            self.pod.forget(ess_monitor_url)
+
+        self.raise_for_job_status(request_id, request_status)
+
+        return request_status
+
+    def poll(self, request_id: str, job: SchedulerJob = None) -> str:
+        """
+        Args:
+            request_id (str): The request id of the job.
+            job (SchedulerJob): The job, to space the polls from its past runtimes.
+        Returns:
+            str: The final status of the job, polled up to pod.max_poll times.
+        """
+        expected = None
+        if self.stats is not None and job is not None:
+            expected = self.stats.expected_runtime(job, BACKOFF_QUANTILE)
 
+        started = time.monotonic()
+        poll_interval = self.pod.poll_interval
+        for _ in range(self.pod.max_poll):
+            time.sleep(poll_interval)
+            request_status = self.get_job_status(request_id)
             if request_status.upper() not in self.progress_status:
-                break
-        else:
-            raise exceptions.LongRunningJobError(request_id)
+                return request_status
+            elapsed = time.monotonic() - started
+            poll_interval = self.next_poll_interval(elapsed, expected)
+        raise exceptions.LongRunningJobError(request_id)
 
-        self.raise_for_job_status(request_id, request_status)
+    def wait_for_callback(self, request_id: str) -> str:
+        """
+        Args:
+            request_id (str): The request id of the job.
+        Returns:
+            str: The final status of the job, as polled from the pod.
+        """
+        deadline = time.monotonic() + self.pod.max_poll * self.pod.poll_interval
+        completion = self.completion(request_id)
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise exceptions.LongRunningJobError(request_id)
+                try:
+                    completion.result(min(self.fallback_poll_interval, remaining))
+                except futures.TimeoutError:
+                    pass
+                else:
+                    # Only trust the pod, wait for another callback if need be.
+                    completion = self.completion(request_id)
+                request_status = self.get_job_status(request_id)
+                if request_status.upper() not in self.progress_status:
+                    return request_status
+        finally:
+            self.listener.registry.discard(request_id)
+
+    def next_poll_interval(self, elapsed: float, expected: float = None) -> float:
+        """
+        Args:
+            elapsed (float): Seconds since the job was submitted.
+            expected (float): The BACKOFF_QUANTILE runtime of the job, if known.
+        Returns:
+            float: Seconds to wait before polling the job status again.
+        """
+        if expected is None or elapsed >= expected:
+            return self.pod.poll_interval
+        return max(self.pod.poll_interval, min(elapsed, expected - elapsed))
 
+    def completion(self, request_id: str) -> Optional[futures.Future]:
+        """
+        Args:
+            request_id (str): The request id of the job.
+        Returns:
+            Future: Resolved with the job status by the callback listener,
+            or None when the scheduler has no listener.
+        """
+        if self.listener is None:
+            return None
+        return self.listener.registry.register(request_id)
+
+    def get_job_status(self, request_id: str) -> str:
+        """
+        Args:
+            request_id (str): The request id of the job.
+        Returns:
+            str: The current status of the job.
+        """
+        monitor_url = self.get_job_monitor_url(request_id)
+        items = self.pod.get_json(monitor_url, key=request_id)["items"]
+        request_status = items[0]["RequestStatus"]
+        self.pod.display_message(f"Request Id : {request_id} {request_status}")
         return request_status
 
     def raise_for_job_status(
@@ -0,0 +1,13 @@
+from .exceptions import (
+    CallbackListenerError,
+    FrozenJobError,
+    LongRunningJobError,
+    ScheduledJobError,
+)
+
+__all__ = [
+    "CallbackListenerError",
+    "FrozenJobError",
+    "LongRunningJobError",
+    "ScheduledJobError",
+]
@@ -23,3 +23,29 @@ class ScheduledJobError(Exception):
 
     def __str__(self):
         return f"Request Id: {self.request_id}, Job Status: {self.job_status}"
+
+
+class FrozenJobError(Exception):
+    """
+    Exception raised when a frozen job is modified.
+    """
+
+    def __init__(self, attribute: str) -> None:
+        self.attribute = attribute
+        super().__init__(self.__doc__)
+
+    def __str__(self):
+        return f"Attribute: {self.attribute}, Message: job is frozen"
+
+
+class CallbackListenerError(Exception):
+    """
+    Exception raised when the callback listener cannot be called back.
+    """
+
+    def __init__(self, reason: str) -> None:
+        self.reason = reason
+        super().__init__(self.__doc__)
+
+    def __str__(self):
+        return f"Reason: {self.reason}"
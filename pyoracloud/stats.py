@@ -0,0 +1,183 @@
+"""
+Historical runtime statistics of Oracle Cloud jobs and reports.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import json
+import math
+import os
+import threading
+import time
+
+GAMMA = 1.1  # Bucket growth, quantiles are within ~5% of the true runtime
+DECAY = 0.98  # Weight kept by older runs on each new run, ~50 run window
+MIN_RUNTIME = 1.0  # Sec
+
+Job = Any  # ess.SchedulerJob or bip.BipReport
+Key = Tuple[str, ...]
+
+
+def runtime_key(job: Job) -> Key:
+    """
+    Args:
+        job (Union[SchedulerJob, BipReport]): The job or report.
+    Returns:
+        Tuple[str, ...]: The key its runtimes are recorded under.
+    """
+    if hasattr(job, "report_name"):
+        return ("bip", job.report_name)
+    return ("ess", job.package, job.definition)
+
+
+class RuntimeSketch:
+    """
+    Rolling quantile sketch of runtimes.
+
+    Runtimes are counted in log spaced buckets, so a sketch stays a few
+    dozen numbers whatever the number of runs, and older runs fade out
+    by DECAY on every new run.
+    """
+
+    __slots__ = ("buckets",)
+
+    def __init__(self, buckets: Dict[int, float] = None) -> None:
+        self.buckets: Dict[int, float] = dict(buckets or {})
+
+    @property
+    def count(self) -> float:
+        return sum(self.buckets.values())
+
+    def add(self, seconds: float) -> None:
+        for index in list(self.buckets):
+            weight = self.buckets[index] * DECAY
+            if weight < 0.01:
+                del self.buckets[index]
+            else:
+                self.buckets[index] = weight
+        index = math.ceil(math.log(max(seconds, MIN_RUNTIME), GAMMA))
+        self.buckets[index] = self.buckets.get(index, 0.0) + 1.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Args:
+            q (float): The quantile, between 0 and 1.
+        Returns:
+            float: The estimated runtime in seconds, None without any runs.
+        """
+        if not self.buckets:
+            return None
+        rank = q * self.count
+        cumulative = 0.0
+        for index in sorted(self.buckets):
+            cumulative += self.buckets[index]
+            if cumulative >= rank:
+                break
+        return 2 * GAMMA ** index / (GAMMA + 1)
+
+
+class RuntimeStore:
+    """
+    Runtime Statistics API
+    """
+
+    def __init__(self, path: str = None) -> None:
+        """
+        Creates a new Runtime Store.
+
+        This class keeps a RuntimeSketch per (JobPackageName, JobDefName)
+        and per BIP report name, and predicts how long a job will run.
+        EnterpriseScheduler.run() records ESS runtimes; BipScheduler only
+        schedules reports, so report runtimes are record()ed by the caller.
+
+        Args:
+            path (str): Optional JSON file to load from and save() to.
+
+        Example:
+        >>> from pyoracloud import ess, stats
+        >>> store = stats.RuntimeStore("~/.pyoracloud_runtimes.json")
+        >>> scheduler = ess.EnterpriseScheduler(pod, stats=store)
+        >>> store.expected_runtime(job)
+        342.6
+        >>> store.longest_first([job_a, job_b])
+        """
+        self.path = os.path.expanduser(path) if path else None
+        self.sketches: Dict[Key, RuntimeSketch] = {}
+        self.__lock = threading.Lock()
+        if self.path and os.path.exists(self.path):
+            self.load()
+
+    def record(self, job: Job, seconds: float) -> None:
+        """
+        Args:
+            job (Union[SchedulerJob, BipReport]): The job that completed.
+            seconds (float): How long it ran.
+        """
+        key = runtime_key(job)
+        with self.__lock:
+            sketch = self.sketches.get(key)
+            if sketch is None:
+                sketch = self.sketches[key] = RuntimeSketch()
+            sketch.add(seconds)
+
+    def expected_runtime(self, job: Job, q: float = 0.5) -> Optional[float]:
+        """
+        Args:
+            job (Union[SchedulerJob, BipReport]): The job to predict.
+            q (float): The quantile of the past runtimes to use.
+        Returns:
+            float: The runtime in seconds, None when the job never ran.
+        """
+        with self.__lock:
+            sketch = self.sketches.get(runtime_key(job))
+            return sketch.quantile(q) if sketch is not None else None
+
+    def eta(self, job: Job, started: float = None, q: float = 0.5) -> Optional[float]:
+        """
+        Args:
+            job (Union[SchedulerJob, BipReport]): The job to predict.
+            started (float): When the job started, as time.time(). Now if None.
+            q (float): The quantile of the past runtimes to use.
+        Returns:
+            float: The predicted completion time, as time.time(), or None.
+        """
+        runtime = self.expected_runtime(job, q)
+        if runtime is None:
+            return None
+        return (time.time() if started is None else started) + runtime
+
+    def longest_first(self, jobs: Iterable[Job]) -> List[Job]:
+        """
+        Args:
+            jobs (Iterable[Union[SchedulerJob, BipReport]]): The jobs to order.
+        Returns:
+            List: The jobs by decreasing expected runtime, unknown ones first.
+        """
+
+        def sort_key(job: Job) -> float:
+            runtime = self.expected_runtime(job)
+            return math.inf if runtime is None else runtime
+
+        return sorted(jobs, key=sort_key, reverse=True)
+
+    def load(self) -> None:
+        with open(self.path) as stats_file:
+            entries = json.load(stats_file)
+        with self.__lock:
+            self.sketches = {
+                tuple(entry["key"]): RuntimeSketch(
+                    {int(index): weight for index, weight in entry["buckets"].items()}
+                )
+                for entry in entries
+            }
+
+    def save(self) -> None:
+        if not self.path:
+            raise ValueError("RuntimeStore has no path to save to")
+        with self.__lock:
+            entries = [
+                {"key": list(key), "buckets": dict(sketch.buckets)}
+                for key, sketch in self.sketches.items()
+            ]
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as stats_file:
+            json.dump(entries, stats_file)
+        os.replace(temp_path, self.path)
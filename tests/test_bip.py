@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""Tests for `pyoracloud.bip` module."""
+import xml.etree.ElementTree as ET
+
+SCHEDULE_REPORT_RESPONSE = b"""<?xml version="1.0" encoding="UTF-8"?>
+<env:Envelope xmlns:env="http://www.w3.org/2003/05/soap-envelope">
+  <env:Body>
+    <ns0:scheduleReportResponse
+        xmlns:ns0="http://xmlns.oracle.com/oxp/service/ScheduleReportService">
+      <ns0:scheduleReportReturn>4242</ns0:scheduleReportReturn>
+    </ns0:scheduleReportResponse>
+  </env:Body>
+</env:Envelope>"""
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {}
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class FakeSession:
+    def __init__(self) -> None:
+        self.posts = []
+
+    def post(self, url: str, data: bytes = None, headers: dict = None):
+        self.posts.append((url, data, headers))
+        return FakeResponse(SCHEDULE_REPORT_RESPONSE)
+
+
+def test_bip_scheduler_run() -> None:
+    """BipScheduler run should post the envelope and return the job id"""
+    from pyoracloud import bip, env
+
+    session = FakeSession()
+    pod = env.Pod("https://server.oraclecloud.com", "x", "x")
+    pod.get_request = lambda: session
+
+    report = bip.BipReport("/Custom/report.xdo", format="pdf")
+    report.add_param("P_DATE", "2021-01-01")
+    job_id = bip.BipScheduler(pod).run(report)
+
+    assert job_id == "4242"
+    url, data, headers = session.posts[0]
+    assert url == f"{pod.url}/xmlpserver/services/ScheduleReportWSSService"
+    assert headers["content-type"].startswith("application/soap+xml")
+
+    envelope = ET.fromstring(data)
+    request = envelope.find(".//sch:scheduleReport/scheduleRequest", bip.NS_MAP)
+    report_request = request.find("reportRequest")
+    assert report_request.findtext("reportAbsolutePath") == "/Custom/report.xdo"
+    assert report_request.findtext("attributeFormat") == "pdf"
+    assert report_request.findtext(".//listOfParamNameValues/name") == "P_DATE"
+
+    assert "/Custom/report.xdo" not in pod.metrics.jobs
+    assert pod.metrics.jobs["4242"]["requests"] == 1
+    assert pod.metrics.jobs["4242"]["bytes_sent"] == len(data)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+
+"""Tests for `pyoracloud.callback` module."""
+import json
+import threading
+import urllib.error
+import urllib.request
+
+
+def post_callback(url: str, message: dict) -> int:
+    """Stand-in for the pod, POSTs a completion notification"""
+    request = urllib.request.Request(
+        url,
+        data=json.dumps(message).encode(),
+        headers={"content-type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status
+    except urllib.error.HTTPError as error:
+        return error.code
+
+
+class FakePod:
+    url = "https://server.oraclecloud.com"
+    max_poll = 3
+    poll_interval = 5
+
+    def __init__(self, request_status: str = "SUCCEEDED") -> None:
+        self.request_status = request_status
+        self.polls = 0
+
+    def get_json(self, url: str, key: str = None):
+        self.polls += 1
+        return {"items": [{"RequestStatus": self.request_status}]}
+
+    def forget(self, url: str) -> None:
+        pass
+
+    def display_message(self, message: str) -> None:
+        pass
+
+
+def test_registry_resolves_registered_future() -> None:
+    """CompletionRegistry should resolve and drop a registered future"""
+    from pyoracloud import callback
+
+    registry = callback.CompletionRegistry()
+    future = registry.register("1")
+    assert registry.resolve("1", "SUCCEEDED")
+    assert future.result(0) == "SUCCEEDED" and len(registry) == 0
+
+
+def test_registry_keeps_early_notification() -> None:
+    """CompletionRegistry should keep a notification that arrives first"""
+    from pyoracloud import callback
+
+    registry = callback.CompletionRegistry()
+    assert not registry.resolve("1", "ERROR")
+    assert registry.register("1").result(0) == "ERROR"
+
+
+def test_parse_notification() -> None:
+    """parse_notification should read JOBS lists and single statuses"""
+    from pyoracloud import callback
+
+    jobs = {"JOBS": [{"JOBID": 1, "STATUS": "SUCCEEDED"}]}
+    single = {"ReqstId": "2", "RequestStatus": "ERROR"}
+    assert callback.parse_notification(json.dumps(jobs).encode()) == [
+        ("1", "SUCCEEDED")
+    ]
+    assert callback.parse_notification(json.dumps(single).encode()) == [
+        ("2", "ERROR")
+    ]
+
+
+def test_listener_resolves_posted_callback() -> None:
+    """CallbackListener should resolve the future of a POSTed callback"""
+    from pyoracloud import callback
+
+    with callback.CallbackListener(host="127.0.0.1") as listener:
+        future = listener.registry.register("123")
+        message = {"JOBS": [{"JOBID": "123", "STATUS": "SUCCEEDED"}]}
+        assert post_callback(listener.url, message) == 200
+        assert future.result(5) == "SUCCEEDED"
+    assert not listener.running
+
+
+def test_monitor_waits_for_callback() -> None:
+    """monitor should return on callback after one confirming poll"""
+    from pyoracloud import callback, ess
+
+    pod = FakePod()
+    with callback.CallbackListener(host="127.0.0.1") as listener:
+        schdlr = ess.EnterpriseScheduler(
+            pod, listener=listener, fallback_poll_interval=5
+        )
+        message = {"ReqstId": "123", "RequestStatus": "SUCCEEDED"}
+        timer = threading.Timer(0.1, post_callback, (listener.url, message))
+        timer.start()
+        assert schdlr.monitor("123") == "SUCCEEDED"
+        timer.join()
+    assert pod.polls == 1 and len(listener.registry) == 0
+
+
+def test_listener_rejects_callback_without_token() -> None:
+    """CallbackListener should reject callbacks without its token"""
+    from pyoracloud import callback
+
+    with callback.CallbackListener() as listener:
+        future = listener.registry.register("123")
+        forged_url = f"http://{listener.host}:{listener.port}/"
+        message = {"ReqstId": "123", "RequestStatus": "SUCCEEDED"}
+        assert post_callback(forged_url, message) == 403
+        assert post_callback(f"{forged_url}?token=x", message) == 403
+        assert not future.done()
+
+
+def test_listener_url_requires_reachable_address() -> None:
+    """CallbackListener url should require a running, reachable listener"""
+    import pytest
+    from pyoracloud import callback, exceptions
+
+    listener = callback.CallbackListener()
+    with pytest.raises(exceptions.CallbackListenerError):
+        listener.url
+
+    with callback.CallbackListener(host="0.0.0.0") as listener:
+        with pytest.raises(exceptions.CallbackListenerError):
+            listener.url
+
+    public_url = "https://integration.example.com/callback"
+    with callback.CallbackListener(host="0.0.0.0", public_url=public_url) as cb:
+        assert cb.url == f"{public_url}?token={cb.token}"
+
+
+def test_listener_rejects_malformed_content_length() -> None:
+    """CallbackListener should answer 400 to a malformed Content-Length"""
+    import http.client
+    from urllib.parse import urlsplit
+    from pyoracloud import callback
+
+    with callback.CallbackListener() as listener:
+        connection = http.client.HTTPConnection(listener.host, listener.port)
+        url = urlsplit(listener.url)
+        connection.putrequest("POST", f"{url.path}?{url.query}")
+        connection.putheader("Content-Length", "abc")
+        connection.endheaders()
+        assert connection.getresponse().status == 400
+        connection.close()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+
+"""Tests for `pyoracloud.env` module."""
+import json
+
+
+class FakeRaw:
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+    def tell(self) -> int:
+        return self.size
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, body: dict = None, etag: str = None):
+        self.status_code = status_code
+        self.content = json.dumps(body).encode() if body is not None else b""
+        self.headers = {"ETag": etag} if etag else {}
+        self.raw = FakeRaw(len(self.content) // 2)
+
+    def json(self):
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise AssertionError(self.status_code)
+
+
+class FakeSession:
+    """Serves one status, with an ETag, honouring If-None-Match"""
+
+    def __init__(self, body: dict, etag: str) -> None:
+        self.body = body
+        self.etag = etag
+        self.sent_headers = []
+
+    def get(self, url: str, headers: dict = None):
+        self.sent_headers.append(headers)
+        if headers.get("If-None-Match") == self.etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.body, self.etag)
+
+
+def test_pod_request_accepts_compression() -> None:
+    """Pod should reuse one session that accepts gzip and deflate"""
+    from pyoracloud import env
+
+    pod = env.Pod("x", "x", "x")
+    assert pod.request.headers["accept-encoding"] == env.ACCEPT_ENCODING
+    assert pod.request is pod.request
+
+
+def test_pod_get_json_conditional() -> None:
+    """Pod get_json should send If-None-Match and reuse the body on 304"""
+    from pyoracloud import env
+
+    body = {"items": [{"RequestStatus": "RUNNING"}]}
+    session = FakeSession(body, '"v1"')
+    pod = env.Pod("x", "x", "x")
+    pod.get_request = lambda: session
+
+    assert pod.get_json("url", key="123") == body
+    assert pod.get_json("url", key="123") == body
+    assert session.sent_headers == [{}, {"If-None-Match": '"v1"'}]
+
+    job = pod.metrics.jobs["123"]
+    assert job["requests"] == 2 and job["not_modified"] == 1
+    assert job["bytes_decoded"] == len(json.dumps(body))
+    assert job["bytes_received"] == len(json.dumps(body)) // 2
+    assert pod.metrics.totals == job
+
+    pod.forget("url")
+    pod.get_json("url")
+    assert session.sent_headers[-1] == {}
+
+
+def test_pod_get_json_unexpected_not_modified() -> None:
+    """Pod get_json should raise on a 304 with nothing cached"""
+    import pytest
+    import requests
+    from pyoracloud import env
+
+    class NotModifiedSession:
+        def get(self, url: str, headers: dict = None):
+            return FakeResponse(304)
+
+    pod = env.Pod("x", "x", "x")
+    pod.get_request = lambda: NotModifiedSession()
+    with pytest.raises(requests.HTTPError):
+        pod.get_json("url")
+
+
+def test_pod_metrics_jobs_are_bounded() -> None:
+    """PodMetrics should keep only the last MAX_JOB_METRICS jobs"""
+    from pyoracloud import env
+
+    metrics = env.PodMetrics()
+    for request_id in range(env.MAX_JOB_METRICS + 10):
+        metrics.record(str(request_id), FakeResponse(200, {}))
+    assert len(metrics.jobs) == env.MAX_JOB_METRICS
+    assert "0" not in metrics.jobs
+    assert metrics.totals["requests"] == env.MAX_JOB_METRICS + 10
@@ -159,3 +159,108 @@ def test_enterprise_scheduler_monitor_url() -> None:
     print(actual_url, expected_url)
 
     assert actual_url == expected_url
+
+
+def test_schedule_job_body_follows_parameters() -> None:
+    """SchedulerJob body should match the payload until the job is frozen"""
+    import json
+    from pyoracloud import ess
+
+    sch_job = ess.SchedulerJob("package", "definition")
+    assert json.loads(sch_job.body) == sch_job.payload
+    sch_job.add_parameter("P1")
+    assert json.loads(sch_job.body)["ESSParameters"] == "P1"
+    sch_job.parameters.append("P2")
+    assert json.loads(sch_job.body)["ESSParameters"] == "P1,P2"
+
+    sch_job.freeze()
+    assert sch_job.body is sch_job.body
+    assert json.loads(sch_job.body) == sch_job.payload
+
+
+def test_schedule_job_freeze() -> None:
+    """A frozen SchedulerJob should reject changes"""
+    import pytest
+    from pyoracloud import ess, exceptions
+
+    sch_job = ess.SchedulerJob("package", "definition")
+    sch_job.add_parameter("P1")
+    assert sch_job.freeze() is sch_job and sch_job.frozen
+    with pytest.raises(exceptions.FrozenJobError):
+        sch_job.add_parameter("P2")
+    with pytest.raises(exceptions.FrozenJobError):
+        sch_job.package = "other"
+    assert sch_job.ess_parameter == "P1"
+
+
+def test_job_batch() -> None:
+    """JobBatch should build the same payloads as SchedulerJob"""
+    from pyoracloud import ess
+
+    sch_job = ess.SchedulerJob("package", "definition")
+    sch_job.add_parameter("P1")
+    sch_job.add_parameter(None)
+
+    batch = ess.JobBatch()
+    batch.add_job(sch_job)
+    batch.add("package", "definition")
+
+    assert len(batch) == 2
+    assert batch.payload(0) == sch_job.payload
+    assert batch.body(0) == sch_job.body
+    assert batch[1].ess_parameter == ess.ESS_PARAM_NULL
+    assert [job.body for job in batch] == [batch.body(0), batch.body(1)]
+    assert batch.packages[0] is batch.packages[1]
+
+
+def test_job_batch_keeps_parameters() -> None:
+    """JobBatch should rebuild parameters that contain commas"""
+    from pyoracloud import ess
+
+    batch = ess.JobBatch()
+    batch.add("package", "definition", ["a,b", "c"])
+    assert batch[0].parameters == ("a,b", "c")
+    assert batch.payload(0)["ESSParameters"] == "a,b,c"
+
+
+def test_schedule_job_copy_and_pickle() -> None:
+    """SchedulerJob should survive copy, deepcopy and pickle, frozen or not"""
+    import copy
+    import pickle
+    from pyoracloud import ess
+
+    sch_job = ess.SchedulerJob("package", "definition")
+    sch_job.add_parameter("P1")
+    frozen_job = ess.SchedulerJob("package", "definition")
+    frozen_job.add_parameter("P1")
+    frozen_job.freeze()
+
+    for job in (sch_job, frozen_job):
+        for clone in (
+            copy.copy(job),
+            copy.deepcopy(job),
+            pickle.loads(pickle.dumps(job)),
+        ):
+            assert clone.frozen == job.frozen
+            assert clone.parameters == job.parameters
+            assert clone.body == job.body
+
+    clone = copy.deepcopy(sch_job)
+    clone.add_parameter("P2")
+    assert sch_job.parameters == ["P1"]
+
+
+def test_job_batch_slice() -> None:
+    """JobBatch should return a JobBatch for slices and reject other keys"""
+    import pytest
+    from pyoracloud import ess
+
+    batch = ess.JobBatch()
+    batch.add("package", "first")
+    batch.add("package", "second", ["P1"])
+
+    tail = batch[1:]
+    assert isinstance(tail, ess.JobBatch) and len(tail) == 1
+    assert tail.payload(0) == batch.payload(1)
+    with pytest.raises(TypeError):
+        batch["0"]
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+
+"""Tests for `pyoracloud.stats` module."""
+
+
+def test_sketch_quantile_within_accuracy() -> None:
+    """RuntimeSketch quantiles should be within the bucket accuracy"""
+    from pyoracloud import stats
+
+    sketch = stats.RuntimeSketch()
+    assert sketch.quantile(0.5) is None
+    for _ in range(30):
+        for seconds in (30, 60, 90):
+            sketch.add(seconds)
+    assert abs(sketch.quantile(0.5) - 60) / 60 < 0.1
+    assert sketch.quantile(0.0) <= sketch.quantile(0.5) <= sketch.quantile(1.0)
+
+
+def test_sketch_forgets_old_runs() -> None:
+    """RuntimeSketch should follow recent runtimes"""
+    from pyoracloud import stats
+
+    sketch = stats.RuntimeSketch()
+    for _ in range(100):
+        sketch.add(1000)
+    for _ in range(100):
+        sketch.add(10)
+    assert abs(sketch.quantile(0.5) - 10) / 10 < 0.1
+
+
+def test_store_eta_and_longest_first() -> None:
+    """RuntimeStore should predict runtimes and order jobs longest first"""
+    from pyoracloud import bip, ess, stats
+
+    store = stats.RuntimeStore()
+    short_job = ess.SchedulerJob("package", "short")
+    long_job = ess.SchedulerJob("package", "long")
+    new_job = ess.SchedulerJob("package", "new")
+    report = bip.BipReport("/Custom/report.xdo")
+    store.record(short_job, 10)
+    store.record(long_job, 1000)
+    store.record(report, 100)
+
+    assert store.eta(new_job) is None
+    assert abs(store.eta(short_job, started=0) - 10) < 1
+    assert abs(store.expected_runtime(report) - 100) < 10
+    assert store.longest_first([short_job, long_job, new_job]) == [
+        new_job,
+        long_job,
+        short_job,
+    ]
+
+
+def test_store_save_and_load(tmp_path) -> None:
+    """RuntimeStore should load the sketches it saved"""
+    from pyoracloud import ess, stats
+
+    path = str(tmp_path / "runtimes.json")
+    job = ess.SchedulerJob("package", "definition")
+    store = stats.RuntimeStore(path)
+    store.record(job, 42)
+    store.save()
+
+    loaded = stats.RuntimeStore(path)
+    assert loaded.expected_runtime(job) == store.expected_runtime(job)
+
+
+def test_store_save_without_path() -> None:
+    """RuntimeStore save should raise ValueError without a path"""
+    import pytest
+    from pyoracloud import stats
+
+    with pytest.raises(ValueError):
+        stats.RuntimeStore().save()
+
+
+class FakeClock:
+    """Stand-in for the time module, sleep() advances the clock"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeResponse:
+    status_code = 200
+    content = b""
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self) -> dict:
+        return {"ReqstId": "1"}
+
+
+class FakeMetrics:
+    def assign(self, key: str, response, sent: int = 0) -> None:
+        pass
+
+
+class FakePod:
+    """Runs every submitted job for `runtime` seconds of the fake clock"""
+
+    url = "https://server.oraclecloud.com"
+    max_poll = 500
+    poll_interval = 10
+
+    def __init__(self, clock: FakeClock) -> None:
+        self.clock = clock
+        self.metrics = FakeMetrics()
+        self.runtime = 0.0
+        self.submitted = 0.0
+
+    def post(self, url: str, data: bytes, key: str = None) -> FakeResponse:
+        self.submitted = self.clock.now
+        return FakeResponse()
+
+    def get_json(self, url: str, key: str = None) -> dict:
+        done = self.clock.now - self.submitted >= self.runtime
+        return {"items": [{"RequestStatus": "SUCCEEDED" if done else "RUNNING"}]}
+
+    def forget(self, url: str) -> None:
+        pass
+
+    def display_message(self, message: str) -> None:
+        pass
+
+
+def test_scheduler_runtimes_follow_faster_jobs(monkeypatch) -> None:
+    """Recorded runtimes should fall when a job gets faster"""
+    from pyoracloud import ess, stats
+
+    clock = FakeClock()
+    monkeypatch.setattr(ess, "time", clock)
+    pod = FakePod(clock)
+    store = stats.RuntimeStore()
+    schdlr = ess.EnterpriseScheduler(pod, stats=store)
+    job = ess.SchedulerJob("package", "definition")
+
+    pod.runtime = 1000
+    for _ in range(20):
+        schdlr.run(job)
+    assert abs(store.expected_runtime(job) - 1000) / 1000 < 0.1
+
+    pod.runtime = 15
+    for _ in range(200):
+        schdlr.run(job)
+    assert store.expected_runtime(job, ess.BACKOFF_QUANTILE) <= 2 * 15
+    assert store.expected_runtime(job) <= 2 * 15